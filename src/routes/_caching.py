@@ -0,0 +1,43 @@
+"""
+Conditional GET support for the by-id routes.
+
+Documents carry system-managed 'saved'/'created' breadcrumbs, so their
+at_time makes a cheap version stamp. When a client replays a read with
+If-None-Match and the document hasn't changed, the route answers 304
+and skips JSON encoding and the response payload entirely.
+"""
+from hashlib import md5
+
+from flask import jsonify, request
+
+
+def _etag_for(doc):
+    """Derive an ETag from the document's audit breadcrumbs (hash fallback)."""
+    for field in ('saved', 'created'):
+        stamp = doc.get(field)
+        if isinstance(stamp, dict) and stamp.get('at_time'):
+            basis = f"{doc.get('_id')}:{stamp['at_time']}"
+            break
+    else:
+        basis = repr(doc)
+    return md5(basis.encode('utf-8')).hexdigest()
+
+
+def conditional_response(doc):
+    """
+    Build the response for a by-id GET with ETag support.
+
+    Args:
+        doc: The document retrieved by the service
+
+    Returns:
+        A 304 response when the client's If-None-Match matches, otherwise
+        the jsonified document with ETag and Cache-Control headers set.
+    """
+    etag = _etag_for(doc)
+    if request.if_none_match.contains(etag):
+        return '', 304
+    response = jsonify(doc)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, max-age=0, must-revalidate'
+    return response, 200
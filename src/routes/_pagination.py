@@ -0,0 +1,91 @@
+"""
+Shared query-parameter parsing for the infinite scroll list routes.
+
+Every list endpoint accepts the same five query parameters with the same
+defaults. parse_pagination validates them once at the route boundary so
+invalid requests are rejected before any service or database work happens.
+"""
+from dataclasses import dataclass, asdict
+
+from api_utils.flask_utils.exceptions import HTTPBadRequest
+
+
+@dataclass(frozen=True, slots=True)
+class PageQuery:
+    """Validated pagination parameters for a list request."""
+
+    name: str | None
+    after_id: str | None
+    limit: int
+    sort_by: str
+    order: str
+
+    def as_kwargs(self):
+        """Return the parameters as keyword arguments for a service call."""
+        return asdict(self)
+
+
+def parse_fields(args, allowed_list_fields):
+    """
+    Parse the optional fields= parameter into a validated field list.
+
+    Args:
+        args: The request's query-parameter MultiDict
+        allowed_list_fields: The domain's whitelist of projectable fields
+
+    Returns:
+        list|None: Sorted requested field names, or None when fields= is absent
+
+    Raises:
+        HTTPBadRequest: If a requested field is not in the whitelist
+    """
+    raw = args.get('fields')
+    if not raw:
+        return None
+    requested = {field.strip() for field in raw.split(',') if field.strip()}
+    unknown = requested - set(allowed_list_fields)
+    if unknown:
+        raise HTTPBadRequest(f"fields must be a subset of {sorted(allowed_list_fields)}")
+    return sorted(requested)
+
+
+def parse_pagination(args, allowed_sort_fields=None):
+    """
+    Parse and validate pagination parameters from request.args.
+
+    Cursor (after_id) pagination is only efficient when the sort lands on
+    a (sort_by, _id) compound index, so callers pass their domain's
+    allowed sort fields and anything else is rejected before Mongo ever
+    sees the query.
+
+    Args:
+        args: The request's query-parameter MultiDict
+        allowed_sort_fields: Optional collection of sort fields backed by indexes
+
+    Returns:
+        PageQuery: The validated pagination parameters
+
+    Raises:
+        HTTPBadRequest: If limit is out of range, order is invalid, or
+            sort_by is not an allowed (indexed) field
+    """
+    limit = args.get('limit', 10, type=int)
+    sort_by = args.get('sort_by', 'name')
+    order = args.get('order', 'asc')
+
+    if limit < 1:
+        raise HTTPBadRequest("limit must be >= 1")
+    if limit > 100:
+        raise HTTPBadRequest("limit must be <= 100")
+    if order not in ('asc', 'desc'):
+        raise HTTPBadRequest("order must be 'asc' or 'desc'")
+    if allowed_sort_fields is not None and sort_by not in allowed_sort_fields:
+        raise HTTPBadRequest(f"sort_by must be one of {sorted(allowed_sort_fields)}")
+
+    return PageQuery(
+        name=args.get('name'),
+        after_id=args.get('after_id'),
+        limit=limit,
+        sort_by=sort_by,
+        order=order,
+    )
@@ -0,0 +1,30 @@
+"""
+Per-request caching of token and breadcrumb for route handlers.
+
+Every handler needs the decoded token and an audit breadcrumb. Both are
+computed from request headers and never change within a request, so they
+are cached on flask.g and reused by any code that asks again.
+"""
+from flask import g
+
+
+def get_request_auth(token_factory, breadcrumb_factory):
+    """
+    Return the (token, breadcrumb) pair for the current request.
+
+    The factories are only invoked on the first call in a request; later
+    calls reuse the values cached on flask.g. Handlers pass their own
+    module-level create_flask_token/create_flask_breadcrumb references so
+    the factories remain patchable per route module in unit tests.
+
+    Args:
+        token_factory: Callable returning the decoded token dict
+        breadcrumb_factory: Callable taking the token and returning a breadcrumb dict
+
+    Returns:
+        tuple: (token, breadcrumb) for the current request
+    """
+    if "token" not in g:
+        g.token = token_factory()
+        g.breadcrumb = breadcrumb_factory(g.token)
+    return g.token, g.breadcrumb
@@ -0,0 +1,48 @@
+"""
+Opt-in NDJSON streaming for the infinite scroll list routes.
+
+Clients that send "Accept: application/x-ndjson" receive the batch items
+one JSON document per line instead of a single buffered JSON body. The
+first byte ships as soon as the first item is serialized, instead of
+after the whole page has been encoded.
+"""
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def wants_ndjson():
+    """Return True when the client asked for NDJSON via the Accept header."""
+    best = request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def ndjson_response(result):
+    """
+    Stream an infinite scroll batch as newline-delimited JSON.
+
+    The body carries only the items (one document per line); the scroll
+    envelope the JSON shape returns rides in headers so NDJSON clients can
+    still tell whether to continue and from where.
+
+    Args:
+        result: Infinite scroll result dict (items/limit/has_more/next_cursor)
+
+    Returns:
+        Response: Streaming response with application/x-ndjson mimetype and
+        X-Has-More / X-Next-Cursor headers
+    """
+    dumps = current_app.json.dumps
+
+    def generate():
+        for item in result['items']:
+            line = dumps(item)
+            if isinstance(line, str):
+                line = line.encode('utf-8')
+            yield line + b'\n'
+
+    response = Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+    response.headers['X-Has-More'] = 'true' if result['has_more'] else 'false'
+    if result['next_cursor']:
+        response.headers['X-Next-Cursor'] = result['next_cursor']
+    return response
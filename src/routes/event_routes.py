@@ -10,7 +10,11 @@ from flask import Blueprint, jsonify, request
 from api_utils.flask_utils.token import create_flask_token
 from api_utils.flask_utils.breadcrumb import create_flask_breadcrumb
 from api_utils.flask_utils.route_wrapper import handle_route_exceptions
-from src.services.event_service import EventService
+from src.routes._caching import conditional_response
+from src.routes._pagination import parse_pagination, parse_fields
+from src.routes._request_auth import get_request_auth
+from src.routes._streaming import wants_ndjson, ndjson_response
+from src.services.event_service import EventService, ALLOWED_SORT_FIELDS, ALLOWED_LIST_FIELDS
 
 import logging
 logger = logging.getLogger(__name__)
@@ -42,14 +46,12 @@ def create_event_routes():
         Returns:
             JSON response with the eventd event document including _id
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
         data = request.get_json() or {}
-        event_id = EventService.create_event(data, token, breadcrumb)
-        event = EventService.get_event(event_id, token, breadcrumb)
+        event = EventService.create_event(data, token, breadcrumb)
         
-        logger.info(f"create_event Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
+        logger.info("create_event Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
         return jsonify(event), 201
     
     @event_routes.route('', methods=['GET'])
@@ -64,6 +66,7 @@ def create_event_routes():
             limit: Items per batch (default: 10, max: 100)
             sort_by: Field to sort by (default: 'name')
             order: Sort order 'asc' or 'desc' (default: 'asc')
+            fields: Optional comma-separated list of fields to return per item
         
         Returns:
             JSON response with infinite scroll results: {
@@ -76,29 +79,17 @@ def create_event_routes():
         Raises:
             400 Bad Request: If invalid parameters provided
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
-        
-        # Get query parameters
-        name = request.args.get('name')
-        after_id = request.args.get('after_id')
-        limit = request.args.get('limit', 10, type=int)
-        sort_by = request.args.get('sort_by', 'name')
-        order = request.args.get('order', 'asc')
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
-        # Service layer validates parameters and raises HTTPBadRequest if invalid
-        # @handle_route_exceptions decorator will catch and format the exception
-        result = EventService.get_events(
-            token, 
-            breadcrumb, 
-            name=name,
-            after_id=after_id,
-            limit=limit,
-            sort_by=sort_by,
-            order=order
-        )
+        # parse_pagination validates the shared query parameters and raises
+        # HTTPBadRequest before any service or database work happens
+        page = parse_pagination(request.args, ALLOWED_SORT_FIELDS)
+        fields = parse_fields(request.args, ALLOWED_LIST_FIELDS)
+        result = EventService.get_events(token, breadcrumb, fields=fields, **page.as_kwargs())
         
-        logger.info(f"get_events Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
+        logger.info("get_events Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        if wants_ndjson():
+            return ndjson_response(result)
         return jsonify(result), 200
     
     @event_routes.route('/<event_id>', methods=['GET'])
@@ -113,12 +104,11 @@ def create_event_routes():
         Returns:
             JSON response with the event document
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
         event = EventService.get_event(event_id, token, breadcrumb)
-        logger.info(f"get_event Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(event), 200
+        logger.info("get_event Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return conditional_response(event)
     
     logger.info("Create Flask Routes Registered")
     return event_routes
\ No newline at end of file
@@ -11,7 +11,11 @@ from flask import Blueprint, jsonify, request
 from api_utils.flask_utils.token import create_flask_token
 from api_utils.flask_utils.breadcrumb import create_flask_breadcrumb
 from api_utils.flask_utils.route_wrapper import handle_route_exceptions
-from src.services.rating_service import RatingService
+from src.routes._caching import conditional_response
+from src.routes._pagination import parse_pagination, parse_fields
+from src.routes._request_auth import get_request_auth
+from src.routes._streaming import wants_ndjson, ndjson_response
+from src.services.rating_service import RatingService, ALLOWED_SORT_FIELDS, ALLOWED_LIST_FIELDS
 
 import logging
 logger = logging.getLogger(__name__)
@@ -43,14 +47,12 @@ def create_rating_routes():
         Returns:
             JSON response with the created rating document including _id
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
         data = request.get_json() or {}
-        rating_id = RatingService.create_rating(data, token, breadcrumb)
-        rating = RatingService.get_rating(rating_id, token, breadcrumb)
+        rating = RatingService.create_rating(data, token, breadcrumb)
         
-        logger.info(f"create_rating Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
+        logger.info("create_rating Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
         return jsonify(rating), 201
     
     @rating_routes.route('', methods=['GET'])
@@ -65,6 +67,7 @@ def create_rating_routes():
             limit: Items per batch (default: 10, max: 100)
             sort_by: Field to sort by (default: 'name')
             order: Sort order 'asc' or 'desc' (default: 'asc')
+            fields: Optional comma-separated list of fields to return per item
         
         Returns:
             JSON response with infinite scroll results: {
@@ -77,29 +80,17 @@ def create_rating_routes():
         Raises:
             400 Bad Request: If invalid parameters provided
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
-        
-        # Get query parameters
-        name = request.args.get('name')
-        after_id = request.args.get('after_id')
-        limit = request.args.get('limit', 10, type=int)
-        sort_by = request.args.get('sort_by', 'name')
-        order = request.args.get('order', 'asc')
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
-        # Service layer validates parameters and raises HTTPBadRequest if invalid
-        # @handle_route_exceptions decorator will catch and format the exception
-        result = RatingService.get_ratings(
-            token, 
-            breadcrumb, 
-            name=name,
-            after_id=after_id,
-            limit=limit,
-            sort_by=sort_by,
-            order=order
-        )
+        # parse_pagination validates the shared query parameters and raises
+        # HTTPBadRequest before any service or database work happens
+        page = parse_pagination(request.args, ALLOWED_SORT_FIELDS)
+        fields = parse_fields(request.args, ALLOWED_LIST_FIELDS)
+        result = RatingService.get_ratings(token, breadcrumb, fields=fields, **page.as_kwargs())
         
-        logger.info(f"get_ratings Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
+        logger.info("get_ratings Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        if wants_ndjson():
+            return ndjson_response(result)
         return jsonify(result), 200
     
     @rating_routes.route('/<rating_id>', methods=['GET'])
@@ -114,12 +105,11 @@ def create_rating_routes():
         Returns:
             JSON response with the rating document
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
         rating = RatingService.get_rating(rating_id, token, breadcrumb)
-        logger.info(f"get_rating Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(rating), 200
+        logger.info("get_rating Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return conditional_response(rating)
     
     @rating_routes.route('/<rating_id>', methods=['PATCH'])
     @handle_route_exceptions
@@ -141,13 +131,12 @@ def create_rating_routes():
         Returns:
             JSON response with the updated rating document
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
         data = request.get_json() or {}
         rating = RatingService.update_rating(rating_id, data, token, breadcrumb)
         
-        logger.info(f"update_rating Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
+        logger.info("update_rating Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
         return jsonify(rating), 200
     
     logger.info("Rating Flask Routes Registered")
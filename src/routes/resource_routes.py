@@ -9,7 +9,11 @@ from flask import Blueprint, jsonify, request
 from api_utils.flask_utils.token import create_flask_token
 from api_utils.flask_utils.breadcrumb import create_flask_breadcrumb
 from api_utils.flask_utils.route_wrapper import handle_route_exceptions
-from src.services.resource_service import ResourceService
+from src.routes._caching import conditional_response
+from src.routes._pagination import parse_pagination, parse_fields
+from src.routes._request_auth import get_request_auth
+from src.routes._streaming import wants_ndjson, ndjson_response
+from src.services.resource_service import ResourceService, ALLOWED_SORT_FIELDS, ALLOWED_LIST_FIELDS
 
 import logging
 logger = logging.getLogger(__name__)
@@ -36,6 +40,7 @@ def create_resource_routes():
             limit: Items per batch (default: 10, max: 100)
             sort_by: Field to sort by (default: 'name')
             order: Sort order 'asc' or 'desc' (default: 'asc')
+            fields: Optional comma-separated list of fields to return per item
         
         Returns:
             JSON response with infinite scroll results: {
@@ -48,29 +53,17 @@ def create_resource_routes():
         Raises:
             400 Bad Request: If invalid parameters provided
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
-        # Get query parameters
-        name = request.args.get('name')
-        after_id = request.args.get('after_id')
-        limit = request.args.get('limit', 10, type=int)
-        sort_by = request.args.get('sort_by', 'name')
-        order = request.args.get('order', 'asc')
+        # parse_pagination validates the shared query parameters and raises
+        # HTTPBadRequest before any service or database work happens
+        page = parse_pagination(request.args, ALLOWED_SORT_FIELDS)
+        fields = parse_fields(request.args, ALLOWED_LIST_FIELDS)
+        result = ResourceService.get_resources(token, breadcrumb, fields=fields, **page.as_kwargs())
         
-        # Service layer validates parameters and raises HTTPBadRequest if invalid
-        # @handle_route_exceptions decorator will catch and format the exception
-        result = ResourceService.get_resources(
-            token, 
-            breadcrumb, 
-            name=name,
-            after_id=after_id,
-            limit=limit,
-            sort_by=sort_by,
-            order=order
-        )
-        
-        logger.info(f"get_resources Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
+        logger.info("get_resources Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        if wants_ndjson():
+            return ndjson_response(result)
         return jsonify(result), 200
     
     @resource_routes.route('/<resource_id>', methods=['GET'])
@@ -85,12 +78,11 @@ def create_resource_routes():
         Returns:
             JSON response with the resource document
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
         resource = ResourceService.get_resource(resource_id, token, breadcrumb)
-        logger.info(f"get_resource Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(resource), 200
+        logger.info("get_resource Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return conditional_response(resource)
     
     logger.info("Resource Flask Routes Registered")
     return resource_routes
\ No newline at end of file
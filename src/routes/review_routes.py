@@ -11,7 +11,11 @@ from flask import Blueprint, jsonify, request
 from api_utils.flask_utils.token import create_flask_token
 from api_utils.flask_utils.breadcrumb import create_flask_breadcrumb
 from api_utils.flask_utils.route_wrapper import handle_route_exceptions
-from src.services.review_service import ReviewService
+from src.routes._caching import conditional_response
+from src.routes._pagination import parse_pagination, parse_fields
+from src.routes._request_auth import get_request_auth
+from src.routes._streaming import wants_ndjson, ndjson_response
+from src.services.review_service import ReviewService, ALLOWED_SORT_FIELDS, ALLOWED_LIST_FIELDS
 
 import logging
 logger = logging.getLogger(__name__)
@@ -43,14 +47,12 @@ def create_review_routes():
         Returns:
             JSON response with the created review document including _id
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
         data = request.get_json() or {}
-        review_id = ReviewService.create_review(data, token, breadcrumb)
-        review = ReviewService.get_review(review_id, token, breadcrumb)
+        review = ReviewService.create_review(data, token, breadcrumb)
         
-        logger.info(f"create_review Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
+        logger.info("create_review Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
         return jsonify(review), 201
     
     @review_routes.route('', methods=['GET'])
@@ -65,6 +67,7 @@ def create_review_routes():
             limit: Items per batch (default: 10, max: 100)
             sort_by: Field to sort by (default: 'name')
             order: Sort order 'asc' or 'desc' (default: 'asc')
+            fields: Optional comma-separated list of fields to return per item
         
         Returns:
             JSON response with infinite scroll results: {
@@ -77,29 +80,17 @@ def create_review_routes():
         Raises:
             400 Bad Request: If invalid parameters provided
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
-        
-        # Get query parameters
-        name = request.args.get('name')
-        after_id = request.args.get('after_id')
-        limit = request.args.get('limit', 10, type=int)
-        sort_by = request.args.get('sort_by', 'name')
-        order = request.args.get('order', 'asc')
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
-        # Service layer validates parameters and raises HTTPBadRequest if invalid
-        # @handle_route_exceptions decorator will catch and format the exception
-        result = ReviewService.get_reviews(
-            token, 
-            breadcrumb, 
-            name=name,
-            after_id=after_id,
-            limit=limit,
-            sort_by=sort_by,
-            order=order
-        )
+        # parse_pagination validates the shared query parameters and raises
+        # HTTPBadRequest before any service or database work happens
+        page = parse_pagination(request.args, ALLOWED_SORT_FIELDS)
+        fields = parse_fields(request.args, ALLOWED_LIST_FIELDS)
+        result = ReviewService.get_reviews(token, breadcrumb, fields=fields, **page.as_kwargs())
         
-        logger.info(f"get_reviews Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
+        logger.info("get_reviews Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        if wants_ndjson():
+            return ndjson_response(result)
         return jsonify(result), 200
     
     @review_routes.route('/<review_id>', methods=['GET'])
@@ -114,12 +105,11 @@ def create_review_routes():
         Returns:
             JSON response with the review document
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
         review = ReviewService.get_review(review_id, token, breadcrumb)
-        logger.info(f"get_review Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(review), 200
+        logger.info("get_review Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return conditional_response(review)
     
     @review_routes.route('/<review_id>', methods=['PATCH'])
     @handle_route_exceptions
@@ -141,13 +131,12 @@ def create_review_routes():
         Returns:
             JSON response with the updated review document
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token, breadcrumb = get_request_auth(create_flask_token, create_flask_breadcrumb)
         
         data = request.get_json() or {}
         review = ReviewService.update_review(review_id, data, token, breadcrumb)
         
-        logger.info(f"update_review Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
+        logger.info("update_review Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
         return jsonify(review), 200
     
     logger.info("Review Flask Routes Registered")
@@ -6,7 +6,12 @@ This is a Flask + MongoDB API that for the sample service in the Mentor Hub syst
 import sys
 import os
 import signal
+from decimal import Decimal
+
+import orjson
+from bson import ObjectId
 from flask import Flask, send_from_directory
+from flask.json.provider import JSONProvider
 
 # Initialize Config Singleton (doesn't require external services)
 from api_utils import Config
@@ -17,53 +22,137 @@ import logging
 logger = logging.getLogger(__name__)
 logger.info("============= Starting Server ===============")
 
-# Initialize MongoIO Singleton and set enumerators and versions
+# MongoIO Singleton is initialized lazily per worker process. Creating the
+# client at import time means Gunicorn forks workers after the socket pool
+# exists, silently corrupting connections; deferring to the first request
+# guarantees each worker builds its own pool. Enumerators and versions are
+# loaded lazily for the same reason (and so boot survives a briefly
+# unreachable Mongo during rollouts).
+import threading
 from api_utils import MongoIO
-mongo = MongoIO.get_instance()
-config.set_enumerators(mongo.get_documents(config.ENUMERATORS_COLLECTION_NAME))
-config.set_versions(mongo.get_documents(config.VERSIONS_COLLECTION_NAME))
+mongo = None
+
+_reference_data_lock = threading.Lock()
+_reference_data_loaded = False
+
+def get_mongo():
+    """Initialize the MongoIO singleton on first use (post-fork safe)."""
+    global mongo
+    if mongo is None:
+        mongo = MongoIO.get_instance()
+    return mongo
+
+def ensure_indexes():
+    """Create the (sort field, _id) compound indexes cursor pagination relies on.
+
+    Every list endpoint sorts on an allowed sort field with _id as the
+    tiebreaker; without a matching compound index Mongo falls back to an
+    in-memory sort. Indexes are created in both directions. Production
+    indexes are managed by migrations, so this only runs when the
+    ENSURE_INDEXES environment variable is set to true.
+    """
+    from pymongo import ASCENDING, DESCENDING
+    mongo_io = get_mongo()
+    for domain, module_name, factory_name, url_prefix in ROUTE_SPECS:
+        service_module = importlib.import_module(f"src.services.{domain.lower()}_service")
+        collection = mongo_io.get_collection(getattr(config, f"{domain.upper()}_COLLECTION_NAME"))
+        for field in service_module.ALLOWED_SORT_FIELDS:
+            for direction, suffix in ((ASCENDING, 'asc'), (DESCENDING, 'desc')):
+                collection.create_index(
+                    [(field, direction), ('_id', ASCENDING)],
+                    background=True,
+                    name=f"{field}_id_{suffix}",
+                )
+    logger.info("Pagination indexes ensured")
+
+def load_reference_data():
+    """Fetch enumerators and versions on first request instead of at boot."""
+    global _reference_data_loaded
+    if _reference_data_loaded:
+        return
+    with _reference_data_lock:
+        if _reference_data_loaded:
+            return
+        mongo_io = get_mongo()
+        config.set_enumerators(mongo_io.get_documents(config.ENUMERATORS_COLLECTION_NAME))
+        config.set_versions(mongo_io.get_documents(config.VERSIONS_COLLECTION_NAME))
+        if os.getenv('ENSURE_INDEXES', 'false').lower() == 'true':
+            ensure_indexes()
+        _reference_data_loaded = True
+        logger.info("Enumerators and versions loaded")
 
 # Initialize Flask App
-from api_utils import MongoJSONEncoder
+# Exact-type dispatch table for the JSON default hook; a dict lookup on
+# type(obj) avoids an isinstance chain for every ObjectId in a 100-doc page
+_JSON_DEFAULTS = {
+    ObjectId: str,
+    Decimal: str,
+}
+
+class ORJSONProvider(JSONProvider):
+    """orjson-backed JSON provider.
+
+    Serializes responses with orjson (a C extension) instead of the stdlib
+    json module. Handles the BSON types that MongoJSONEncoder covered:
+    ObjectId and Decimal become strings, datetime is handled natively.
+    """
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+    @staticmethod
+    def _default(obj):
+        """Convert non-native types (ObjectId, Decimal) to strings."""
+        convert = _JSON_DEFAULTS.get(type(obj))
+        if convert is not None:
+            return convert(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self._default, option=self._OPTIONS)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
-app.json = MongoJSONEncoder(app)
+app.json = ORJSONProvider(app)
+app.before_request(load_reference_data)
 
 # Route registration (all grouped together)
+import importlib
 from api_utils import (
     create_metric_routes,
     create_dev_login_routes,
     create_config_routes,
     create_explorer_routes
 )
-from src.routes.curriculum_routes import create_curriculum_routes
-from src.routes.rating_routes import create_rating_routes
-from src.routes.review_routes import create_review_routes
-from src.routes.event_routes import create_event_routes
-from src.routes.resource_routes import create_resource_routes
-from src.routes.path_routes import create_path_routes
+
+# Domain blueprints, registered from a table so each route/service module
+# is imported only when its blueprint is actually wired up
+ROUTE_SPECS = [
+    ("Curriculum", "src.routes.curriculum_routes", "create_curriculum_routes", "/api/curriculum"),
+    ("Rating", "src.routes.rating_routes", "create_rating_routes", "/api/rating"),
+    ("Review", "src.routes.review_routes", "create_review_routes", "/api/review"),
+    ("Event", "src.routes.event_routes", "create_event_routes", "/api/event"),
+    ("Resource", "src.routes.resource_routes", "create_resource_routes", "/api/resource"),
+    ("Path", "src.routes.path_routes", "create_path_routes", "/api/path"),
+]
+
 # Register route blueprints
 # Register explorer routes with template's docs directory
 docs_dir = os.path.join(os.path.dirname(__file__), '..', 'docs')
 app.register_blueprint(create_explorer_routes(docs_dir), url_prefix='/docs')
 app.register_blueprint(create_config_routes(), url_prefix='/api/config')
 app.register_blueprint(create_dev_login_routes(), url_prefix='/dev-login')
-app.register_blueprint(create_curriculum_routes(), url_prefix='/api/curriculum')
-app.register_blueprint(create_rating_routes(), url_prefix='/api/rating')
-app.register_blueprint(create_review_routes(), url_prefix='/api/review')
-app.register_blueprint(create_event_routes(), url_prefix='/api/event')
-app.register_blueprint(create_resource_routes(), url_prefix='/api/resource')
-app.register_blueprint(create_path_routes(), url_prefix='/api/path')
+for domain, module_name, factory_name, url_prefix in ROUTE_SPECS:
+    factory = getattr(importlib.import_module(module_name), factory_name)
+    app.register_blueprint(factory(), url_prefix=url_prefix)
 metrics = create_metric_routes(app)  # This exposes /metrics endpoint
 
 logger.info("============= Routes Registered ===============")
 logger.info("  /api/config - Configuration endpoint")
 logger.info("  /dev-login - Dev Login (returns 404 if disabled)")
-logger.info("  /api/curriculum - Curriculum domain endpoints")
-logger.info("  /api/rating - Rating domain endpoints")
-logger.info("  /api/review - Review domain endpoints")
-logger.info("  /api/event - Event domain endpoints")
-logger.info("  /api/resource - Resource domain endpoints")
-logger.info("  /api/path - Path domain endpoints")
+for domain, module_name, factory_name, url_prefix in ROUTE_SPECS:
+    logger.info("  %s - %s domain endpoints", url_prefix, domain)
 logger.info("  /docs - API Explorer")
 logger.info("  /metrics - Prometheus metrics endpoint")
 
@@ -71,7 +160,7 @@ logger.info("  /metrics - Prometheus metrics endpoint")
 def handle_exit(signum, frame):
     """Handle graceful shutdown on SIGTERM/SIGINT."""
     global mongo
-    logger.info(f"Received signal {signum}. Initiating shutdown...")
+    logger.info("Received signal %s. Initiating shutdown...", signum)
     
     # Disconnect from MongoDB if connected
     if mongo is not None:
@@ -79,7 +168,7 @@ def handle_exit(signum, frame):
         try:
             mongo.disconnect()
         except Exception as e:
-            logger.error(f"Error disconnecting from MongoDB: {e}")
+            logger.error("Error disconnecting from MongoDB: %s", e)
     
     logger.info("Shutdown complete.")
     sys.exit(0)
@@ -88,8 +177,17 @@ def handle_exit(signum, frame):
 signal.signal(signal.SIGTERM, handle_exit)
 signal.signal(signal.SIGINT, handle_exit)
 
+# Expose an ASGI adapter so the app can run under Uvicorn/Hypercorn with an
+# event loop multiplexing requests instead of one thread per request.
+try:
+    from asgiref.wsgi import WsgiToAsgi
+    asgi_app = WsgiToAsgi(app)
+except ImportError:
+    # asgiref not installed - WSGI deployment (Gunicorn) still works
+    asgi_app = None
+
 # Expose app for Gunicorn or direct execution
 if __name__ == "__main__":
     api_port = config.MEMBER_API_PORT
-    logger.info(f"Starting Flask server on port {api_port}")
+    logger.info("Starting Flask server on port %s", api_port)
     app.run(host="0.0.0.0", port=api_port, debug=False)
\ No newline at end of file
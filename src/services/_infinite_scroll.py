@@ -0,0 +1,159 @@
+"""
+Infinite scroll query execution for the domain services.
+
+Local replacement for the api_utils execute_infinite_scroll_query helper.
+Behavior matches the shared helper (validation, cursor pagination, result
+envelope) but the find() call also accepts a projection so list endpoints
+can return trimmed documents.
+"""
+import logging
+import re
+from functools import lru_cache
+
+from bson import ObjectId
+from api_utils.flask_utils.exceptions import HTTPBadRequest
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_sort_value(document, sort_by):
+    """Walk a dotted sort path (e.g. 'saved.at_time') into a document.
+
+    Returns:
+        tuple: (value, True) when the full path resolves, (None, False)
+        otherwise. The found flag matters because None can be a real
+        stored value.
+    """
+    value = document
+    for part in sort_by.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return None, False
+        value = value[part]
+    return value, True
+
+
+@lru_cache(maxsize=None)
+def _index_names(collection):
+    """List (and memoize) a collection's index names for hint checks.
+
+    One index_information round trip per collection per process; the
+    handful of domain collections keeps the unbounded cache tiny.
+    """
+    try:
+        return frozenset(collection.index_information())
+    except Exception as e:
+        logger.warning("Could not list indexes for hinting: %s", e)
+        return frozenset()
+
+
+@lru_cache(maxsize=1024)
+def _name_filter(name):
+    """Build (and memoize) the anchored name filter for a search term.
+
+    Search terms repeat heavily across sessions, so the escape/format work
+    is cached; the returned dict is shared and must not be mutated.
+    """
+    return {'$regex': f'^{re.escape(name.strip())}', '$options': 'i'}
+
+
+def execute_infinite_scroll_query(collection, name=None, after_id=None, limit=10,
+                                  sort_by='name', order='asc', allowed_sort_fields=None,
+                                  projection=None):
+    """
+    Run a cursor-paginated, sorted, filtered query against a collection.
+
+    Args:
+        collection: pymongo collection to query
+        name: Optional name filter (simple search)
+        after_id: Cursor (ID of last item from previous batch, None for first request)
+        limit: Items per batch
+        sort_by: Field to sort by
+        order: Sort order ('asc' or 'desc')
+        allowed_sort_fields: Sort fields backed by indexes for this domain
+        projection: Optional Mongo projection limiting returned fields
+
+    Returns:
+        dict: {
+            'items': [...],
+            'limit': int,
+            'has_more': bool,
+            'next_cursor': str|None  # ID of last item, or None if no more
+        }
+
+    Raises:
+        HTTPBadRequest: If invalid parameters provided
+    """
+    if limit < 1:
+        raise HTTPBadRequest("limit must be >= 1")
+    if limit > 100:
+        raise HTTPBadRequest("limit must be <= 100")
+    if allowed_sort_fields is not None and sort_by not in allowed_sort_fields:
+        raise HTTPBadRequest(f"sort_by must be one of {sorted(allowed_sort_fields)}")
+    if order not in ('asc', 'desc'):
+        raise HTTPBadRequest("order must be 'asc' or 'desc'")
+    if after_id is not None and not ObjectId.is_valid(after_id):
+        raise HTTPBadRequest("after_id must be a valid MongoDB ObjectId")
+
+    query = {}
+    if name:
+        # Anchored to a prefix so the query is an index range on name rather
+        # than an unanchored regex, which forces a collection scan
+        query['name'] = _name_filter(name)
+
+    direction = 1 if order == 'asc' else -1
+    keyset = after_id is not None
+    if keyset:
+        # Resolve the anchor document's sort value so the batch is a true
+        # keyset range on the (sort_by, _id) index rather than an offset walk
+        anchor_id = ObjectId(after_id)
+        anchor = collection.find_one({'_id': anchor_id}, {sort_by: 1})
+        # The projection returns nested dicts for dotted sort fields like
+        # 'saved.at_time', so the path has to be walked, not looked up
+        anchor_value, found = (None, False) if anchor is None \
+            else _resolve_sort_value(anchor, sort_by)
+        if found:
+            op = '$gt' if order == 'asc' else '$lt'
+            query['$or'] = [
+                {sort_by: {op: anchor_value}},
+                {sort_by: anchor_value, '_id': {'$gt': anchor_id}},
+            ]
+        else:
+            # Anchor deleted (or sort field absent on it); fall back to an
+            # _id range so the scroll still makes forward progress
+            query['_id'] = {'$gt': anchor_id}
+
+    # Fetch limit+1 documents so has_more is known without a second query
+    cursor = collection.find(query, projection)
+    cursor = cursor.sort([(sort_by, direction), ('_id', 1)])
+    cursor = cursor.limit(limit + 1)
+    # Size driver batches to the page instead of pymongo's default (101),
+    # so small pages don't over-fetch into the client buffer
+    cursor = cursor.batch_size(limit + 1)
+    if keyset and '$or' in query:
+        # Hint only when the (sort_by, _id) compound index actually exists
+        # (index creation is owned by migrations or ENSURE_INDEXES); a hint
+        # naming a missing index fails the query outright instead of just
+        # running it slower. The _id-fallback path is never hinted since it
+        # ranges on _id, not the sort field.
+        suffix = 'asc' if direction == 1 else 'desc'
+        if f"{sort_by}_id_{suffix}" in _index_names(collection):
+            cursor = cursor.hint([(sort_by, direction), ('_id', 1)])
+
+    items = list(cursor)
+    has_more = len(items) > limit
+    if has_more:
+        items = items[:limit]
+
+    # Stringify _id once per document here rather than in the JSON
+    # provider's per-field default hook during serialization
+    for item in items:
+        if '_id' in item:
+            item['_id'] = str(item['_id'])
+
+    next_cursor = items[-1]['_id'] if (has_more and items) else None
+    return {
+        'items': items,
+        'limit': limit,
+        'has_more': has_more,
+        'next_cursor': next_cursor,
+    }
@@ -5,7 +5,7 @@ Handles RBAC checks and MongoDB operations for Curriculum domain.
 """
 from api_utils import MongoIO, Config
 from api_utils.flask_utils.exceptions import HTTPBadRequest, HTTPForbidden, HTTPNotFound, HTTPInternalServerError
-from api_utils.mongo_utils import execute_infinite_scroll_query
+from src.services._infinite_scroll import execute_infinite_scroll_query
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,6 +13,9 @@ logger = logging.getLogger(__name__)
 # Allowed sort fields for Curriculum domain
 ALLOWED_SORT_FIELDS = ['name', 'description', 'status', 'created.at_time', 'saved.at_time']
 
+# Fields clients may request via the fields= list projection
+ALLOWED_LIST_FIELDS = ['name', 'description', 'status', 'created', 'saved']
+
 
 class CurriculumService:
     """
@@ -82,7 +85,7 @@ class CurriculumService:
             breadcrumb: Breadcrumb dictionary for logging (contains at_time, by_user, from_ip, correlation_id)
             
         Returns:
-            str: The ID of the created curriculum document
+            dict: The created curriculum document including _id
         """
         try:
             CurriculumService._check_permission(token, 'create')
@@ -101,7 +104,7 @@ class CurriculumService:
             config = Config.get_instance()
             curriculum_id = mongo.create_document(config.CURRICULUM_COLLECTION_NAME, data)
             logger.info(f"Created curriculum { curriculum_id} for user {token.get('user_id')}")
-            return curriculum_id
+            return {**data, '_id': curriculum_id}
         except HTTPForbidden:
             raise
         except Exception as e:
@@ -110,7 +113,7 @@ class CurriculumService:
             raise HTTPInternalServerError(f"Failed to create curriculum: {error_msg}")
     
     @staticmethod
-    def get_curriculums(token, breadcrumb, name=None, after_id=None, limit=10, sort_by='name', order='asc'):
+    def get_curriculums(token, breadcrumb, name=None, after_id=None, limit=10, sort_by='name', order='asc', fields=None):
         """
         Get infinite scroll batch of sorted, filtered curriculum documents.
         
@@ -122,6 +125,7 @@ class CurriculumService:
             limit: Items per batch
             sort_by: Field to sort by
             order: Sort order ('asc' or 'desc')
+            fields: Optional list of fields to project into the returned items
         
         Returns:
             dict: {
@@ -147,6 +151,7 @@ class CurriculumService:
                 sort_by=sort_by,
                 order=order,
                 allowed_sort_fields=ALLOWED_SORT_FIELDS,
+                projection={field: 1 for field in fields} if fields else None,
             )
             logger.info(
                 f"Retrieved {len(result['items'])} curriculums (has_more={result['has_more']}) "
@@ -5,7 +5,7 @@ Handles RBAC checks and MongoDB operations for Event domain.
 """
 from api_utils import MongoIO, Config
 from api_utils.flask_utils.exceptions import HTTPBadRequest, HTTPForbidden, HTTPNotFound, HTTPInternalServerError
-from api_utils.mongo_utils import execute_infinite_scroll_query
+from src.services._infinite_scroll import execute_infinite_scroll_query
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,6 +13,9 @@ logger = logging.getLogger(__name__)
 # Allowed sort fields for Event domain
 ALLOWED_SORT_FIELDS = ['name', 'description', 'created.at_time']
 
+# Fields clients may request via the fields= list projection
+ALLOWED_LIST_FIELDS = ['name', 'description', 'status', 'created']
+
 
 class EventService:
     """
@@ -61,7 +64,7 @@ class EventService:
             breadcrumb: Breadcrumb dictionary for logging (contains at_time, by_user, from_ip, correlation_id)
             
         Returns:
-            str: The ID of the eventd event document
+            dict: The created event document including _id
         """
         try:
             EventService._check_permission(token, 'create')
@@ -79,7 +82,7 @@ class EventService:
             config = Config.get_instance()
             event_id = mongo.create_document(config.EVENT_COLLECTION_NAME, data)
             logger.info(f"Created event { event_id} for user {token.get('user_id')}")
-            return event_id
+            return {**data, '_id': event_id}
         except HTTPForbidden:
             raise
         except Exception as e:
@@ -88,7 +91,7 @@ class EventService:
             raise HTTPInternalServerError(f"Failed to create event: {error_msg}")
     
     @staticmethod
-    def get_events(token, breadcrumb, name=None, after_id=None, limit=10, sort_by='name', order='asc'):
+    def get_events(token, breadcrumb, name=None, after_id=None, limit=10, sort_by='name', order='asc', fields=None):
         """
         Get infinite scroll batch of sorted, filtered event documents.
         
@@ -100,6 +103,7 @@ class EventService:
             limit: Items per batch
             sort_by: Field to sort by
             order: Sort order ('asc' or 'desc')
+            fields: Optional list of fields to project into the returned items
         
         Returns:
             dict: {
@@ -125,6 +129,7 @@ class EventService:
                 sort_by=sort_by,
                 order=order,
                 allowed_sort_fields=ALLOWED_SORT_FIELDS,
+                projection={field: 1 for field in fields} if fields else None,
             )
             logger.info(
                 f"Retrieved {len(result['items'])} events (has_more={result['has_more']}) "
@@ -0,0 +1,179 @@
+"""
+Shared service behavior for the read-only domains (Path, Resource).
+
+path_service and resource_service were identical modulo the collection
+constant, so the scroll-list and by-id logic lives here once and the
+domain modules declare themselves with a handful of class parameters.
+Optimizations to the read path (projection, keyset cursor, batch size)
+then only need to be applied in one place.
+"""
+from bson import ObjectId
+from src.services._infinite_scroll import execute_infinite_scroll_query
+from api_utils.flask_utils.exceptions import HTTPBadRequest, HTTPForbidden, HTTPNotFound, HTTPInternalServerError
+from functools import wraps
+import logging
+
+logger = logging.getLogger(__name__)
+
+# RBAC is not implemented yet; gate the permission calls behind a constant
+# so the no-op check costs nothing per request until it does something
+_RBAC_ENABLED = False
+
+
+def translate_errors(*passthrough, message):
+    """
+    Wrap a service method in the standard error-translation scaffold.
+
+    Known HTTP exceptions in ``passthrough`` propagate untouched; anything
+    else is logged and re-raised as HTTPInternalServerError. ``message``
+    is a callable receiving the method's arguments so the 500 detail can
+    name the domain (and document id) involved.
+    """
+    def decorate(func):
+        @wraps(func)
+        def wrapper(cls, *args, **kwargs):
+            try:
+                return func(cls, *args, **kwargs)
+            except passthrough:
+                raise
+            except Exception as e:
+                detail = message(cls, *args, **kwargs)
+                logger.error("%s: %s", detail, e)
+                raise HTTPInternalServerError(detail)
+        return wrapper
+    return decorate
+
+
+@translate_errors(HTTPBadRequest, HTTPForbidden,
+                  message=lambda cls, *a, **k: f"Failed to retrieve {cls._plural}")
+def _get_batch(cls, token, breadcrumb, name=None, after_id=None, limit=10,
+               sort_by='name', order='asc', fields=None):
+    """
+    Get infinite scroll batch of sorted, filtered documents.
+
+    Args:
+        token: Authentication token
+        breadcrumb: Audit breadcrumb
+        name: Optional name filter (prefix search)
+        after_id: Cursor (ID of last item from previous batch, None for first request)
+        limit: Items per batch
+        sort_by: Field to sort by
+        order: Sort order ('asc' or 'desc')
+        fields: Optional list of fields to project into the returned items
+            (defaults to the domain's list contract)
+
+    Returns:
+        dict: {
+            'items': [...],  # trimmed list documents, not full records
+            'limit': int,
+            'has_more': bool,
+            'next_cursor': str|None  # ID of last item, or None if no more
+        }
+
+    Raises:
+        HTTPBadRequest: If invalid parameters provided
+    """
+    user_id = token.get('user_id')
+    if _RBAC_ENABLED:
+        cls._check_permission(token, 'read')
+    collection = cls._get_collection()
+    result = execute_infinite_scroll_query(
+        collection,
+        name=name,
+        after_id=after_id,
+        limit=limit,
+        sort_by=sort_by,
+        order=order,
+        allowed_sort_fields=cls.ALLOWED_SORT_FIELDS,
+        projection={field: 1 for field in (fields or cls.ALLOWED_LIST_FIELDS)},
+    )
+    logger.info(
+        "Retrieved %d %s (has_more=%s) for user %s",
+        len(result['items']), cls._plural, result['has_more'], user_id,
+    )
+    return result
+
+
+@translate_errors(HTTPNotFound, HTTPForbidden,
+                  message=lambda cls, document_id, *a, **k:
+                  f"Failed to retrieve {cls._domain.lower()} {document_id}")
+def _get_one(cls, document_id, token, breadcrumb):
+    """
+    Retrieve a specific document by ID.
+
+    Args:
+        document_id: The document ID to retrieve
+        token: Token dictionary with user_id and roles
+        breadcrumb: Breadcrumb dictionary for logging
+
+    Returns:
+        dict: The document
+
+    Raises:
+        HTTPNotFound: If the document is not found
+    """
+    user_id = token.get('user_id')
+    if _RBAC_ENABLED:
+        cls._check_permission(token, 'read')
+
+    # Reject malformed IDs locally instead of paying a Mongo round trip
+    # to find nothing (common with probing/abuse traffic)
+    if not ObjectId.is_valid(document_id):
+        raise HTTPNotFound(f"{cls._domain} {document_id} not found")
+
+    document = cls._get_collection().find_one({'_id': ObjectId(document_id)})
+    if document is None:
+        raise HTTPNotFound(f"{cls._domain} {document_id} not found")
+
+    logger.info("Retrieved %s %s for user %s", cls._domain.lower(), document_id, user_id)
+    return document
+
+
+class ReadOnlyDomainService:
+    """
+    Base class for read-only domain services.
+
+    Subclasses declare their domain at class-construction time:
+
+        class PathService(ReadOnlyDomainService, domain='Path', plural='paths',
+                          get_mongo=..., get_collection=..., get_collection_name=...,
+                          allowed_sort_fields=..., allowed_list_fields=...):
+            ...
+
+    __init_subclass__ captures the parameters and installs get_<plural> and
+    get_<domain> classmethods, so each domain module stays a declaration
+    plus its cached collection bindings.
+    """
+
+    def __init_subclass__(cls, *, domain=None, plural=None, get_mongo=None,
+                          get_collection=None, get_collection_name=None,
+                          allowed_sort_fields=None, allowed_list_fields=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if domain is None:
+            return
+        cls._domain = domain
+        cls._plural = plural or f"{domain.lower()}s"
+        cls._get_mongo = staticmethod(get_mongo)
+        cls._get_collection = staticmethod(get_collection)
+        cls._get_collection_name = staticmethod(get_collection_name)
+        cls.ALLOWED_SORT_FIELDS = allowed_sort_fields
+        cls.ALLOWED_LIST_FIELDS = allowed_list_fields
+        setattr(cls, f"get_{cls._plural}", classmethod(_get_batch))
+        setattr(cls, f"get_{domain.lower()}", classmethod(_get_one))
+
+    @staticmethod
+    def _check_permission(token, operation):
+        """
+        Check if the user has permission to perform an operation.
+
+        Args:
+            token: Token dictionary with user_id and roles
+            operation: The operation being performed (e.g., 'read')
+
+        Raises:
+            HTTPForbidden: If user doesn't have required permission
+
+        Note: This is a placeholder for future RBAC implementation.
+        For now, all operations require a valid token (authentication only).
+        """
+        pass
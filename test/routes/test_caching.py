@@ -0,0 +1,34 @@
+"""
+Unit tests for the conditional GET helpers.
+
+_etag_for derives its version stamp without a request context, so the
+derivation rules are tested directly here; the If-None-Match round trip
+through a route lives in test_review_routes.
+"""
+from src.routes._caching import _etag_for
+
+
+def test_etag_prefers_saved_stamp():
+    """Test the ETag tracks saved.at_time and ignores body changes."""
+    doc = {
+        "_id": "123",
+        "name": "a",
+        "created": {"at_time": "t1"},
+        "saved": {"at_time": "t2"},
+    }
+    assert _etag_for(doc) == _etag_for(dict(doc, name="b"))
+    assert _etag_for(doc) != _etag_for(dict(doc, saved={"at_time": "t3"}))
+
+
+def test_etag_falls_back_to_created_stamp():
+    """Test the ETag uses created.at_time when there is no saved stamp."""
+    doc = {"_id": "123", "name": "a", "created": {"at_time": "t1"}}
+    assert _etag_for(doc) == _etag_for(dict(doc, name="b"))
+    assert _etag_for(doc) != _etag_for(dict(doc, created={"at_time": "t2"}))
+
+
+def test_etag_falls_back_to_repr():
+    """Test the ETag hashes the whole document when no stamp exists."""
+    doc = {"_id": "123", "name": "a"}
+    assert _etag_for(doc) == _etag_for(dict(doc))
+    assert _etag_for(doc) != _etag_for(dict(doc, name="b"))
@@ -29,10 +29,8 @@ class TestCurriculumRoutes(unittest.TestCase):
     @patch("src.routes.curriculum_routes.create_flask_token")
     @patch("src.routes.curriculum_routes.create_flask_breadcrumb")
     @patch("src.routes.curriculum_routes.CurriculumService.create_curriculum")
-    @patch("src.routes.curriculum_routes.CurriculumService.get_curriculum")
     def test_create_curriculum_success(
         self,
-        mock_get_curriculum,
         mock_create_curriculum,
         mock_create_breadcrumb,
         mock_create_token,
@@ -41,8 +39,7 @@ class TestCurriculumRoutes(unittest.TestCase):
         mock_create_token.return_value = self.mock_token
         mock_create_breadcrumb.return_value = self.mock_breadcrumb
 
-        mock_create_curriculum.return_value = "123"
-        mock_get_curriculum.return_value = {
+        mock_create_curriculum.return_value = {
             "_id": "123",
             "name": "test-curriculum",
             "status": "active",
@@ -57,9 +54,6 @@ class TestCurriculumRoutes(unittest.TestCase):
         data = response.json
         self.assertEqual(data["_id"], "123")
         mock_create_curriculum.assert_called_once()
-        mock_get_curriculum.assert_called_once_with(
-            "123", self.mock_token, self.mock_breadcrumb
-        )
 
     @patch("src.routes.curriculum_routes.create_flask_token")
     @patch("src.routes.curriculum_routes.create_flask_breadcrumb")
@@ -99,6 +93,7 @@ class TestCurriculumRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
     @patch("src.routes.curriculum_routes.create_flask_token")
@@ -136,6 +131,7 @@ class TestCurriculumRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
     @patch("src.routes.curriculum_routes.create_flask_token")
@@ -25,10 +25,8 @@ class TestEventRoutes(unittest.TestCase):
     @patch("src.routes.event_routes.create_flask_token")
     @patch("src.routes.event_routes.create_flask_breadcrumb")
     @patch("src.routes.event_routes.EventService.create_event")
-    @patch("src.routes.event_routes.EventService.get_event")
     def test_create_event_success(
         self,
-        mock_get_event,
         mock_create_event,
         mock_create_breadcrumb,
         mock_create_token,
@@ -37,8 +35,7 @@ class TestEventRoutes(unittest.TestCase):
         mock_create_token.return_value = self.mock_token
         mock_create_breadcrumb.return_value = self.mock_breadcrumb
 
-        mock_create_event.return_value = "123"
-        mock_get_event.return_value = {
+        mock_create_event.return_value = {
             "_id": "123",
             "name": "test-event",
             "status": "active",
@@ -53,9 +50,6 @@ class TestEventRoutes(unittest.TestCase):
         data = response.json
         self.assertEqual(data["_id"], "123")
         mock_create_event.assert_called_once()
-        mock_get_event.assert_called_once_with(
-            "123", self.mock_token, self.mock_breadcrumb
-        )
 
     @patch("src.routes.event_routes.create_flask_token")
     @patch("src.routes.event_routes.create_flask_breadcrumb")
@@ -95,6 +89,7 @@ class TestEventRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
     @patch("src.routes.event_routes.create_flask_token")
@@ -60,6 +60,7 @@ class TestPathRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
     @patch("src.routes.path_routes.create_flask_token")
@@ -97,6 +98,7 @@ class TestPathRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
     @patch("src.routes.path_routes.create_flask_token")
@@ -29,10 +29,8 @@ class TestRatingRoutes(unittest.TestCase):
     @patch("src.routes.rating_routes.create_flask_token")
     @patch("src.routes.rating_routes.create_flask_breadcrumb")
     @patch("src.routes.rating_routes.RatingService.create_rating")
-    @patch("src.routes.rating_routes.RatingService.get_rating")
     def test_create_rating_success(
         self,
-        mock_get_rating,
         mock_create_rating,
         mock_create_breadcrumb,
         mock_create_token,
@@ -41,8 +39,7 @@ class TestRatingRoutes(unittest.TestCase):
         mock_create_token.return_value = self.mock_token
         mock_create_breadcrumb.return_value = self.mock_breadcrumb
 
-        mock_create_rating.return_value = "123"
-        mock_get_rating.return_value = {
+        mock_create_rating.return_value = {
             "_id": "123",
             "name": "test-rating",
             "status": "active",
@@ -57,9 +54,6 @@ class TestRatingRoutes(unittest.TestCase):
         data = response.json
         self.assertEqual(data["_id"], "123")
         mock_create_rating.assert_called_once()
-        mock_get_rating.assert_called_once_with(
-            "123", self.mock_token, self.mock_breadcrumb
-        )
 
     @patch("src.routes.rating_routes.create_flask_token")
     @patch("src.routes.rating_routes.create_flask_breadcrumb")
@@ -99,6 +93,7 @@ class TestRatingRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
     @patch("src.routes.rating_routes.create_flask_token")
@@ -136,6 +131,7 @@ class TestRatingRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
     @patch("src.routes.rating_routes.create_flask_token")
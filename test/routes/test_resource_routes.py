@@ -60,6 +60,7 @@ class TestResourceRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
     @patch("src.routes.resource_routes.create_flask_token")
@@ -97,6 +98,7 @@ class TestResourceRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
     @patch("src.routes.resource_routes.create_flask_token")
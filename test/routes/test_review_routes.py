@@ -1,209 +1,260 @@
 """
-Unit tests for Review routes.
+Unit tests for Review routes (pytest-native).
 
 These tests validate the Flask route layer for the Review domain, using the
 generated blueprint factory and mocking out the underlying service and
-token/breadcrumb helpers from api_utils.
+token/breadcrumb helpers from api_utils. The app and patchers are
+module-scoped fixtures so they are built once per test session.
 """
-import unittest
+import functools
+import json
+
+import pytest
 from unittest.mock import patch
 from flask import Flask
 from src.routes.review_routes import create_review_routes
+from api_utils.flask_utils.exceptions import HTTPNotFound, HTTPUnauthorized
+
+# Plain patch, autospec pinned off: autospec'd mocks are dramatically more
+# expensive to construct and nothing here relies on signature checking.
+_patch = functools.partial(patch, autospec=False)
+
+MOCK_TOKEN = {"user_id": "test_user", "roles": ["admin"]}
+MOCK_BREADCRUMB = {"at_time": "sometime", "correlation_id": "correlation_ID"}
+
+# Stable service return payloads, built once; tests treat them as read-only
+REVIEW_123 = {"_id": "123", "name": "test-review", "status": "active"}
+REVIEW_DETAIL = {"_id": "123", "name": "review1"}
+REVIEWS_BATCH = {
+    "items": [
+        {"_id": "123", "name": "review1"},
+        {"_id": "456", "name": "review2"},
+    ],
+    "limit": 10,
+    "has_more": False,
+    "next_cursor": None,
+}
+REVIEWS_FILTERED_BATCH = {
+    "items": [{"_id": "123", "name": "test-review"}],
+    "limit": 10,
+    "has_more": False,
+    "next_cursor": None,
+}
+
+
+def _expected_kw(**overrides):
+    """Expected get_reviews kwargs: the route defaults plus any overrides."""
+    base = dict(name=None, after_id=None, limit=10, sort_by="name", order="asc", fields=None)
+    base.update(overrides)
+    return base
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Flask app, built once; it holds no per-test state."""
+    flask_app = Flask(__name__)
+    flask_app.register_blueprint(
+        create_review_routes(),
+        url_prefix="/api/review",
+    )
+    return flask_app
+
+
+def _request(app, path, method="GET", **kwargs):
+    """Dispatch a request directly, skipping the WSGI test-client stack.
+
+    These tests only assert on status code and JSON body, so
+    test_request_context + full_dispatch_request gives the same response
+    without the werkzeug client machinery.
+    """
+    with app.test_request_context(path, method=method, **kwargs):
+        return app.full_dispatch_request()
+
+
+@pytest.fixture(scope="module")
+def _route_patchers():
+    """Start the route-layer patchers once per module."""
+    patchers = [
+        _patch("src.routes.review_routes.create_flask_token"),
+        _patch("src.routes.review_routes.create_flask_breadcrumb"),
+        _patch("src.routes.review_routes.ReviewService.create_review"),
+        _patch("src.routes.review_routes.ReviewService.get_review"),
+        _patch("src.routes.review_routes.ReviewService.get_reviews"),
+    ]
+    mocks = {p.attribute: p.start() for p in patchers}
+    yield mocks
+    for p in patchers:
+        p.stop()
+
+
+@pytest.fixture
+def mocks(_route_patchers):
+    """Per-test view of the shared mocks, reset with default auth stubs."""
+    for mock in _route_patchers.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    _route_patchers["create_flask_token"].return_value = MOCK_TOKEN
+    _route_patchers["create_flask_breadcrumb"].return_value = MOCK_BREADCRUMB
+    return _route_patchers
+
+
+def test_create_review_success(app, mocks):
+    """Test POST /api/review for successful creation."""
+    mocks["create_review"].return_value = REVIEW_123
+
+    response = _request(
+        app, "/api/review", method="POST",
+        json={"name": "test-review", "status": "active"},
+    )
+
+    assert response.status_code == 201
+    data = response.get_json()
+    assert data["_id"] == "123"
+    mocks["create_review"].assert_called_once()
+
+
+def test_get_reviews_no_filter(app, mocks):
+    """Test GET /api/review without name filter."""
+    mocks["get_reviews"].return_value = REVIEWS_BATCH
+
+    response = _request(app, "/api/review")
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert isinstance(data, dict)
+    assert "items" in data
+    assert len(data["items"]) == 2
+    mocks["get_reviews"].assert_called_once_with(
+        MOCK_TOKEN, MOCK_BREADCRUMB, **_expected_kw()
+    )
+
+
+def test_get_reviews_with_name_filter(app, mocks):
+    """Test GET /api/review with name query parameter."""
+    mocks["get_reviews"].return_value = REVIEWS_FILTERED_BATCH
+
+    response = _request(app, "/api/review?name=test")
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert isinstance(data, dict)
+    assert "items" in data
+    assert len(data["items"]) == 1
+    mocks["get_reviews"].assert_called_once_with(
+        MOCK_TOKEN, MOCK_BREADCRUMB, **_expected_kw(name="test")
+    )
+
+
+def test_get_review_success(app, mocks):
+    """Test GET /api/review/<id> for successful response."""
+    mocks["get_review"].return_value = REVIEW_DETAIL
+
+    response = _request(app, "/api/review/123")
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["_id"] == "123"
+    mocks["get_review"].assert_called_once_with("123", MOCK_TOKEN, MOCK_BREADCRUMB)
+
+
+def test_get_review_not_found(app, mocks):
+    """Test GET /api/review/<id> when document is not found."""
+    mocks["get_review"].side_effect = HTTPNotFound("Review 999 not found")
+
+    response = _request(app, "/api/review/999")
+
+    assert response.status_code == 404
+    data = response.get_json()
+    assert data["error"] == "Review 999 not found"
+
+
+def test_create_review_unauthorized(app, mocks):
+    """Test POST /api/review when token is invalid."""
+    mocks["create_flask_token"].side_effect = HTTPUnauthorized("Invalid token")
+
+    response = _request(
+        app, "/api/review", method="POST",
+        json={"name": "test"},
+    )
+
+    assert response.status_code == 401
+    data = response.get_json()
+    assert "error" in data
+
+
+def test_get_review_conditional_roundtrip(app, mocks):
+    """Test GET /api/review/<id> replays with If-None-Match return a 304."""
+    mocks["get_review"].return_value = dict(
+        REVIEW_DETAIL, saved={"at_time": "2024-01-01T00:00:00Z"}
+    )
+
+    first = _request(app, "/api/review/123")
+
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, max-age=0, must-revalidate"
+    etag = first.headers["ETag"]
+
+    replay = _request(
+        app, "/api/review/123", headers={"If-None-Match": etag},
+    )
+
+    assert replay.status_code == 304
+    assert replay.get_data() == b""
+
+
+def test_get_reviews_ndjson(app, mocks):
+    """Test GET /api/review streams NDJSON with scroll metadata headers."""
+    mocks["get_reviews"].return_value = dict(
+        REVIEWS_BATCH, has_more=True, next_cursor="456"
+    )
+
+    response = _request(
+        app, "/api/review", headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    lines = response.get_data().splitlines()
+    assert [json.loads(line)["_id"] for line in lines] == ["123", "456"]
+    assert response.headers["X-Has-More"] == "true"
+    assert response.headers["X-Next-Cursor"] == "456"
+
+
+@pytest.mark.parametrize(
+    "query, message",
+    [
+        ("limit=0", "limit must be >= 1"),
+        ("limit=101", "limit must be <= 100"),
+        ("order=sideways", "order must be 'asc' or 'desc'"),
+        ("sort_by=unknown", "sort_by must be one of"),
+    ],
+)
+def test_get_reviews_invalid_params(app, mocks, query, message):
+    """Test GET /api/review rejects bad pagination params at the boundary."""
+    response = _request(app, f"/api/review?{query}")
+
+    assert response.status_code == 400
+    data = response.get_json()
+    assert message in data["error"]
+    mocks["get_reviews"].assert_not_called()
+
+
+def test_get_reviews_fields_projection(app, mocks):
+    """Test GET /api/review passes a validated fields list to the service."""
+    mocks["get_reviews"].return_value = REVIEWS_BATCH
+
+    response = _request(app, "/api/review?fields=name,status")
+
+    assert response.status_code == 200
+    mocks["get_reviews"].assert_called_once_with(
+        MOCK_TOKEN, MOCK_BREADCRUMB, **_expected_kw(fields=["name", "status"])
+    )
+
 
+def test_get_reviews_unknown_field(app, mocks):
+    """Test GET /api/review rejects a fields entry outside the whitelist."""
+    response = _request(app, "/api/review?fields=password")
 
-class TestReviewRoutes(unittest.TestCase):
-    """Test cases for Review routes."""
-
-    def setUp(self):
-        """Set up the Flask test client and app context."""
-        self.app = Flask(__name__)
-        self.app.register_blueprint(
-            create_review_routes(),
-            url_prefix="/api/review",
-        )
-        self.client = self.app.test_client()
-
-        self.mock_token = {"user_id": "test_user", "roles": ["admin"]}
-        self.mock_breadcrumb = {"at_time": "sometime", "correlation_id": "correlation_ID"}
-
-    @patch("src.routes.review_routes.create_flask_token")
-    @patch("src.routes.review_routes.create_flask_breadcrumb")
-    @patch("src.routes.review_routes.ReviewService.create_review")
-    @patch("src.routes.review_routes.ReviewService.get_review")
-    def test_create_review_success(
-        self,
-        mock_get_review,
-        mock_create_review,
-        mock_create_breadcrumb,
-        mock_create_token,
-    ):
-        """Test POST /api/review for successful creation."""
-        mock_create_token.return_value = self.mock_token
-        mock_create_breadcrumb.return_value = self.mock_breadcrumb
-
-        mock_create_review.return_value = "123"
-        mock_get_review.return_value = {
-            "_id": "123",
-            "name": "test-review",
-            "status": "active",
-        }
-
-        response = self.client.post(
-            "/api/review",
-            json={"name": "test-review", "status": "active"},
-        )
-
-        self.assertEqual(response.status_code, 201)
-        data = response.json
-        self.assertEqual(data["_id"], "123")
-        mock_create_review.assert_called_once()
-        mock_get_review.assert_called_once_with(
-            "123", self.mock_token, self.mock_breadcrumb
-        )
-
-    @patch("src.routes.review_routes.create_flask_token")
-    @patch("src.routes.review_routes.create_flask_breadcrumb")
-    @patch("src.routes.review_routes.ReviewService.get_reviews")
-    def test_get_reviews_no_filter(
-        self,
-        mock_get_reviews,
-        mock_create_breadcrumb,
-        mock_create_token,
-    ):
-        """Test GET /api/review without name filter."""
-        mock_create_token.return_value = self.mock_token
-        mock_create_breadcrumb.return_value = self.mock_breadcrumb
-
-        mock_get_reviews.return_value = {
-            "items": [
-                {"_id": "123", "name": "review1"},
-                {"_id": "456", "name": "review2"},
-            ],
-            "limit": 10,
-            "has_more": False,
-            "next_cursor": None,
-        }
-
-        response = self.client.get("/api/review")
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json
-        self.assertIsInstance(data, dict)
-        self.assertIn("items", data)
-        self.assertEqual(len(data["items"]), 2)
-        mock_get_reviews.assert_called_once_with(
-            self.mock_token,
-            self.mock_breadcrumb,
-            name=None,
-            after_id=None,
-            limit=10,
-            sort_by="name",
-            order="asc",
-        )
-
-    @patch("src.routes.review_routes.create_flask_token")
-    @patch("src.routes.review_routes.create_flask_breadcrumb")
-    @patch("src.routes.review_routes.ReviewService.get_reviews")
-    def test_get_reviews_with_name_filter(
-        self,
-        mock_get_reviews,
-        mock_create_breadcrumb,
-        mock_create_token,
-    ):
-        """Test GET /api/review with name query parameter."""
-        mock_create_token.return_value = self.mock_token
-        mock_create_breadcrumb.return_value = self.mock_breadcrumb
-
-        mock_get_reviews.return_value = {
-            "items": [{"_id": "123", "name": "test-review"}],
-            "limit": 10,
-            "has_more": False,
-            "next_cursor": None,
-        }
-
-        response = self.client.get("/api/review?name=test")
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json
-        self.assertIsInstance(data, dict)
-        self.assertIn("items", data)
-        self.assertEqual(len(data["items"]), 1)
-        mock_get_reviews.assert_called_once_with(
-            self.mock_token,
-            self.mock_breadcrumb,
-            name="test",
-            after_id=None,
-            limit=10,
-            sort_by="name",
-            order="asc",
-        )
-
-    @patch("src.routes.review_routes.create_flask_token")
-    @patch("src.routes.review_routes.create_flask_breadcrumb")
-    @patch("src.routes.review_routes.ReviewService.get_review")
-    def test_get_review_success(
-        self,
-        mock_get_review,
-        mock_create_breadcrumb,
-        mock_create_token,
-    ):
-        """Test GET /api/review/<id> for successful response."""
-        mock_create_token.return_value = self.mock_token
-        mock_create_breadcrumb.return_value = self.mock_breadcrumb
-
-        mock_get_review.return_value = {
-            "_id": "123",
-            "name": "review1",
-        }
-
-        response = self.client.get("/api/review/123")
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json
-        self.assertEqual(data["_id"], "123")
-        mock_get_review.assert_called_once_with(
-            "123", self.mock_token, self.mock_breadcrumb
-        )
-
-    @patch("src.routes.review_routes.create_flask_token")
-    @patch("src.routes.review_routes.create_flask_breadcrumb")
-    @patch("src.routes.review_routes.ReviewService.get_review")
-    def test_get_review_not_found(
-        self,
-        mock_get_review,
-        mock_create_breadcrumb,
-        mock_create_token,
-    ):
-        """Test GET /api/review/<id> when document is not found."""
-        from api_utils.flask_utils.exceptions import HTTPNotFound
-
-        mock_create_token.return_value = self.mock_token
-        mock_create_breadcrumb.return_value = self.mock_breadcrumb
-
-        mock_get_review.side_effect = HTTPNotFound(
-            "Review 999 not found"
-        )
-
-        response = self.client.get("/api/review/999")
-
-        self.assertEqual(response.status_code, 404)
-        self.assertEqual(response.json["error"], "Review 999 not found")
-
-    @patch("src.routes.review_routes.create_flask_token")
-    def test_create_review_unauthorized(self, mock_create_token):
-        """Test POST /api/review when token is invalid."""
-        from api_utils.flask_utils.exceptions import HTTPUnauthorized
-
-        mock_create_token.side_effect = HTTPUnauthorized("Invalid token")
-
-        response = self.client.post(
-            "/api/review",
-            json={"name": "test"},
-        )
-
-        self.assertEqual(response.status_code, 401)
-        self.assertIn("error", response.json)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    assert response.status_code == 400
+    data = response.get_json()
+    assert "fields must be a subset of" in data["error"]
+    mocks["get_reviews"].assert_not_called()
@@ -0,0 +1,46 @@
+"""
+Shared pytest configuration for the service test suites.
+
+These suites are safe to shard across processes with pytest-xdist
+(``pytest -n auto``): every module patches its own service module's
+Config/MongoIO singletons and holds no module-level mutable mocks, so
+workers never share state. They are not safe for thread-level
+parallelism, since the patches swap module attributes in place.
+
+Also home to the scaffolding the scroll tests share; import it with
+``from services.conftest import _FakeCursor, _mock_scroll_collection``.
+"""
+from unittest.mock import Mock
+
+
+class _FakeCursor(list):
+    """Minimal pymongo cursor stand-in.
+
+    Already iterable as a list, the chain methods return self, and hint()
+    records its argument so tests can assert on it without mock dunder
+    machinery or per-iteration lambdas.
+    """
+
+    hint_spec = None
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def limit(self, *args, **kwargs):
+        return self
+
+    def batch_size(self, *args, **kwargs):
+        return self
+
+    def hint(self, spec):
+        self.hint_spec = spec
+        return self
+
+
+def _mock_scroll_collection(mock_mongo, docs):
+    """Install and return a collection mock whose find() yields docs."""
+    mock_collection = Mock()
+    mock_cursor = _FakeCursor(docs)
+    mock_collection.find.return_value = mock_cursor
+    mock_mongo.get_collection.return_value = mock_collection
+    return mock_collection, mock_cursor
@@ -44,11 +44,11 @@ class TestCurriculumService(unittest.TestCase):
             "status": "active",
         }
 
-        curriculum_id = CurriculumService.create_curriculum(
+        curriculum = CurriculumService.create_curriculum(
             data, self.mock_token, self.mock_breadcrumb
         )
 
-        self.assertEqual(curriculum_id, "123")
+        self.assertEqual(curriculum["_id"], "123")
         mock_mongo.create_document.assert_called_once()
         call_args = mock_mongo.create_document.call_args
         self.assertEqual(call_args[0][0], "Curriculum")
@@ -92,6 +92,7 @@ class TestCurriculumService(unittest.TestCase):
         mock_collection.find.return_value = mock_cursor
         mock_cursor.sort.return_value = mock_cursor
         mock_cursor.limit.return_value = mock_cursor
+        mock_cursor.batch_size.return_value = mock_cursor
         mock_cursor.__iter__ = lambda self: iter(
             [
                 {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "curriculum1"},
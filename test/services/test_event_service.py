@@ -44,11 +44,11 @@ class TestEventService(unittest.TestCase):
             "status": "active",
         }
 
-        event_id = EventService.create_event(
+        event = EventService.create_event(
             data, self.mock_token, self.mock_breadcrumb
         )
 
-        self.assertEqual(event_id, "123")
+        self.assertEqual(event["_id"], "123")
         mock_mongo.create_document.assert_called_once()
         call_args = mock_mongo.create_document.call_args
         self.assertEqual(call_args[0][0], "Event")
@@ -103,7 +103,7 @@ class TestEventService(unittest.TestCase):
             {"name": "test"}, self.mock_token, breadcrumb
         )
 
-        self.assertEqual(result, "123")
+        self.assertEqual(result["_id"], "123")
         call_args = mock_mongo.create_document.call_args
         created_data = call_args[0][1]
         self.assertEqual(created_data["created"], breadcrumb)
@@ -122,6 +122,7 @@ class TestEventService(unittest.TestCase):
         mock_collection.find.return_value = mock_cursor
         mock_cursor.sort.return_value = mock_cursor
         mock_cursor.limit.return_value = mock_cursor
+        mock_cursor.batch_size.return_value = mock_cursor
         mock_cursor.__iter__ = lambda self: iter(
             [
                 {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "event1"},
@@ -1,281 +1,203 @@
 """
-Unit tests for Path service (consume-style, read-only).
+Unit tests for Path service (consume-style, read-only, pytest-native).
+
+The Config/Mongo singleton patchers are module-scoped; each test gets the
+shared mongo mock freshly reset through the mock_mongo fixture.
 """
-import unittest
-from unittest.mock import patch, MagicMock
+import functools
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, Mock
 from bson import ObjectId
+from services.conftest import _mock_scroll_collection
+from src.services import path_service
 from src.services.path_service import PathService
 from api_utils.flask_utils.exceptions import (
     HTTPBadRequest,
-    HTTPForbidden,
     HTTPNotFound,
     HTTPInternalServerError,
 )
 
-
-class TestPathService(unittest.TestCase):
-    """Test cases for PathService."""
-
-    def setUp(self):
-        """Set up the test fixture."""
-        self.mock_token = {"user_id": "test_user", "roles": ["developer"]}
-        self.mock_breadcrumb = {
-            "at_time": "2024-01-01T00:00:00Z",
-            "by_user": "test_user",
-            "from_ip": "127.0.0.1",
-            "correlation_id": "test-correlation-id",
-        }
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_paths_first_batch(self, mock_get_mongo, mock_get_config):
-        """Test successful retrieval of first batch (no cursor)."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-
-        mock_collection = MagicMock()
-        mock_cursor = MagicMock()
-        mock_collection.find.return_value = mock_cursor
-        mock_cursor.sort.return_value = mock_cursor
-        mock_cursor.limit.return_value = mock_cursor
-        mock_cursor.__iter__ = lambda self: iter(
-            [
-                {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "path1"},
-                {"_id": ObjectId("507f1f77bcf86cd799439012"), "name": "path2"},
-            ]
+# Plain patch, autospec pinned off: autospec'd mocks are dramatically more
+# expensive to construct and nothing here relies on signature checking.
+_patch = functools.partial(patch, autospec=False)
+
+MOCK_TOKEN = {"user_id": "test_user", "roles": ["developer"]}
+MOCK_BREADCRUMB = {
+    "at_time": "2024-01-01T00:00:00Z",
+    "by_user": "test_user",
+    "from_ip": "127.0.0.1",
+    "correlation_id": "test-correlation-id",
+}
+
+# Shared ObjectIds, parsed once instead of per test
+OID_1 = ObjectId("507f1f77bcf86cd799439011")
+OID_2 = ObjectId("507f1f77bcf86cd799439012")
+OID_3 = ObjectId("507f1f77bcf86cd799439013")
+OID_MISSING = ObjectId("507f1f77bcf86cd799439099")
+
+
+@pytest.fixture(scope="module")
+def _patched_singletons():
+    """Patch the Config/Mongo singletons once per module."""
+    config_patch = _patch("src.services.path_service.Config.get_instance")
+    config_patch.start().return_value = SimpleNamespace(PATH_COLLECTION_NAME="Path")
+    mongo_patch = _patch("src.services.path_service.MongoIO.get_instance")
+    mock_mongo = mongo_patch.start().return_value
+    yield mock_mongo
+    mongo_patch.stop()
+    config_patch.stop()
+
+
+@pytest.fixture
+def mock_mongo(_patched_singletons):
+    """Per-test view of the shared mongo mock with cleared service caches."""
+    path_service._get_mongo.cache_clear()
+    path_service._get_collection_name.cache_clear()
+    path_service._get_path_collection.cache_clear()
+    _patched_singletons.reset_mock(return_value=True, side_effect=True)
+    return _patched_singletons
+
+
+def test_get_paths_first_batch(mock_mongo):
+    """Test successful retrieval of first batch (no cursor)."""
+    _mock_scroll_collection(
+        mock_mongo,
+        [
+            {"_id": OID_1, "name": "path1"},
+            {"_id": OID_2, "name": "path2"},
+        ],
+    )
+
+    result = PathService.get_paths(MOCK_TOKEN, MOCK_BREADCRUMB, limit=10)
+
+    assert "items" in result
+    assert "limit" in result
+    assert "has_more" in result
+    assert "next_cursor" in result
+    assert len(result["items"]) == 2
+    assert result["limit"] == 10
+    assert result["has_more"] is False
+    assert result["next_cursor"] is None
+
+
+def test_get_paths_with_name_filter(mock_mongo):
+    """Test retrieval of documents with name filter."""
+    mock_collection, _ = _mock_scroll_collection(
+        mock_mongo,
+        [
+            {"_id": OID_1, "name": "test-path"},
+        ],
+    )
+
+    result = PathService.get_paths(MOCK_TOKEN, MOCK_BREADCRUMB, name="test")
+
+    assert len(result["items"]) == 1
+    find_call = mock_collection.find.call_args[0][0]
+    assert "name" in find_call
+    assert find_call["name"]["$regex"] == "^test"
+    assert find_call["name"]["$options"] == "i"
+
+
+def test_get_paths_second_batch(mock_mongo):
+    """Test keyset filter and index hint are applied when after_id is provided."""
+    mock_collection, mock_cursor = _mock_scroll_collection(
+        mock_mongo,
+        [
+            {"_id": OID_3, "name": "path3"},
+        ],
+    )
+    mock_collection.find_one.return_value = {"name": "path2"}
+    # Declare the compound index so the keyset path applies its hint
+    mock_collection.index_information.return_value = {"name_id_asc": {}}
+
+    result = PathService.get_paths(
+        MOCK_TOKEN,
+        MOCK_BREADCRUMB,
+        after_id=str(OID_2),
+    )
+
+    assert len(result["items"]) == 1
+    find_call = mock_collection.find.call_args[0][0]
+    assert "$or" in find_call
+    assert find_call["$or"][0] == {"name": {"$gt": "path2"}}
+    assert mock_cursor.hint_spec == [("name", 1), ("_id", 1)]
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        (dict(limit=0), "limit must be >= 1"),
+        (dict(limit=101), "limit must be <= 100"),
+        (dict(sort_by="invalid_field"), "sort_by must be one of"),
+        (dict(order="invalid"), "order must be 'asc' or 'desc'"),
+        (dict(after_id="invalid"), "after_id must be a valid MongoDB ObjectId"),
+    ],
+)
+def test_get_paths_invalid_args(mock_mongo, kwargs, message):
+    """Test get_paths raises HTTPBadRequest for each invalid argument."""
+    with pytest.raises(HTTPBadRequest) as exc_info:
+        PathService.get_paths(MOCK_TOKEN, MOCK_BREADCRUMB, **kwargs)
+    assert message in str(exc_info.value)
+
+
+def test_get_path_success(mock_mongo):
+    """Test retrieval of a specific path document.
+
+    Also exercises the _check_permission placeholder so it keeps coverage
+    without a dedicated test.
+    """
+    PathService._check_permission(MOCK_TOKEN, "read")
+    mock_collection = Mock()
+    mock_collection.find_one.return_value = {
+        "_id": OID_1,
+        "name": "path1",
+    }
+    mock_mongo.get_collection.return_value = mock_collection
+
+    result = PathService.get_path(
+        str(OID_1), MOCK_TOKEN, MOCK_BREADCRUMB
+    )
+
+    assert result is not None
+    assert result["_id"] == OID_1
+    mock_collection.find_one.assert_called_once_with(
+        {"_id": OID_1}
+    )
+
+
+def test_get_path_not_found(mock_mongo):
+    """Test get_path raises HTTPNotFound when document not found."""
+    mock_collection = Mock()
+    mock_collection.find_one.return_value = None
+    mock_mongo.get_collection.return_value = mock_collection
+
+    with pytest.raises(HTTPNotFound) as exc_info:
+        PathService.get_path(
+            str(OID_MISSING), MOCK_TOKEN, MOCK_BREADCRUMB
         )
+    assert str(OID_MISSING) in str(exc_info.value)
 
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = mock_collection
-        mock_get_mongo.return_value = mock_mongo
 
-        result = PathService.get_paths(
-            self.mock_token, self.mock_breadcrumb, limit=10
-        )
+def test_get_paths_handles_exception(mock_mongo):
+    """Test get_paths handles exceptions properly."""
+    mock_collection = Mock()
+    mock_collection.find.side_effect = Exception("Database error")
+    mock_mongo.get_collection.return_value = mock_collection
 
-        self.assertIn("items", result)
-        self.assertIn("limit", result)
-        self.assertIn("has_more", result)
-        self.assertIn("next_cursor", result)
-        self.assertEqual(len(result["items"]), 2)
-        self.assertEqual(result["limit"], 10)
-        self.assertFalse(result["has_more"])
-        self.assertIsNone(result["next_cursor"])
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_paths_with_name_filter(
-        self, mock_get_mongo, mock_get_config
-    ):
-        """Test retrieval of documents with name filter."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-
-        mock_collection = MagicMock()
-        mock_cursor = MagicMock()
-        mock_collection.find.return_value = mock_cursor
-        mock_cursor.sort.return_value = mock_cursor
-        mock_cursor.limit.return_value = mock_cursor
-        mock_cursor.__iter__ = lambda self: iter(
-            [
-                {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "test-path"},
-            ]
-        )
+    with pytest.raises(HTTPInternalServerError):
+        PathService.get_paths(MOCK_TOKEN, MOCK_BREADCRUMB)
 
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = mock_collection
-        mock_get_mongo.return_value = mock_mongo
 
-        result = PathService.get_paths(
-            self.mock_token, self.mock_breadcrumb, name="test"
-        )
+def test_get_path_handles_exception(mock_mongo):
+    """Test get_path handles exceptions properly."""
+    mock_collection = Mock()
+    mock_collection.find_one.side_effect = Exception("Database error")
+    mock_mongo.get_collection.return_value = mock_collection
 
-        self.assertEqual(len(result["items"]), 1)
-        find_call = mock_collection.find.call_args[0][0]
-        self.assertIn("name", find_call)
-        self.assertEqual(find_call["name"]["$regex"], "test")
-        self.assertEqual(find_call["name"]["$options"], "i")
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_paths_invalid_limit_too_small(self, mock_get_mongo, mock_get_config):
-        """Test get_paths raises HTTPBadRequest for limit < 1."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPBadRequest) as context:
-            PathService.get_paths(
-                self.mock_token, self.mock_breadcrumb, limit=0
-            )
-        self.assertIn("limit must be >= 1", str(context.exception))
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_paths_invalid_limit_too_large(self, mock_get_mongo, mock_get_config):
-        """Test get_paths raises HTTPBadRequest for limit > 100."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPBadRequest) as context:
-            PathService.get_paths(
-                self.mock_token, self.mock_breadcrumb, limit=101
-            )
-        self.assertIn("limit must be <= 100", str(context.exception))
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_paths_invalid_sort_by(self, mock_get_mongo, mock_get_config):
-        """Test get_paths raises HTTPBadRequest for invalid sort_by."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPBadRequest) as context:
-            PathService.get_paths(
-                self.mock_token,
-                self.mock_breadcrumb,
-                sort_by="invalid_field",
-            )
-        self.assertIn("sort_by must be one of", str(context.exception))
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_paths_invalid_order(self, mock_get_mongo, mock_get_config):
-        """Test get_paths raises HTTPBadRequest for invalid order."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPBadRequest) as context:
-            PathService.get_paths(
-                self.mock_token,
-                self.mock_breadcrumb,
-                order="invalid",
-            )
-        self.assertIn("order must be 'asc' or 'desc'", str(context.exception))
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_paths_invalid_after_id(self, mock_get_mongo, mock_get_config):
-        """Test get_paths raises HTTPBadRequest for invalid after_id."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPBadRequest) as context:
-            PathService.get_paths(
-                self.mock_token,
-                self.mock_breadcrumb,
-                after_id="invalid",
-            )
-        self.assertIn("after_id must be a valid MongoDB ObjectId", str(context.exception))
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_path_success(self, mock_get_mongo, mock_get_config):
-        """Test successful retrieval of a specific path document."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.get_document.return_value = {
-            "_id": "123",
-            "name": "path1",
-        }
-        mock_get_mongo.return_value = mock_mongo
-
-        result = PathService.get_path(
-            "123", self.mock_token, self.mock_breadcrumb
+    with pytest.raises(HTTPInternalServerError):
+        PathService.get_path(
+            str(OID_1), MOCK_TOKEN, MOCK_BREADCRUMB
         )
 
-        self.assertIsNotNone(result)
-        self.assertEqual(result["_id"], "123")
-        mock_mongo.get_document.assert_called_once_with("Path", "123")
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_path_not_found(self, mock_get_mongo, mock_get_config):
-        """Test get_path raises HTTPNotFound when document not found."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.get_document.return_value = None
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPNotFound) as context:
-            PathService.get_path(
-                "999", self.mock_token, self.mock_breadcrumb
-            )
-        self.assertIn("999", str(context.exception))
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_paths_handles_exception(
-        self, mock_get_mongo, mock_get_config
-    ):
-        """Test get_paths handles exceptions properly."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-
-        mock_collection = MagicMock()
-        mock_collection.find.side_effect = Exception("Database error")
-
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = mock_collection
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPInternalServerError):
-            PathService.get_paths(
-                self.mock_token, self.mock_breadcrumb
-            )
-
-    @patch("src.services.path_service.Config.get_instance")
-    @patch("src.services.path_service.MongoIO.get_instance")
-    def test_get_path_handles_exception(
-        self, mock_get_mongo, mock_get_config
-    ):
-        """Test get_path handles exceptions properly."""
-        mock_config = MagicMock()
-        mock_config.PATH_COLLECTION_NAME = "Path"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.get_document.side_effect = Exception("Database error")
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPInternalServerError):
-            PathService.get_path(
-                "123", self.mock_token, self.mock_breadcrumb
-            )
-
-    def test_check_permission_placeholder(self):
-        """Test that _check_permission is a placeholder that allows all operations."""
-        PathService._check_permission(self.mock_token, "read")
-        self.assertTrue(True)
-
-
-if __name__ == "__main__":
-    unittest.main()
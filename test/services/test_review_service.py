@@ -44,11 +44,11 @@ class TestReviewService(unittest.TestCase):
             "status": "active",
         }
 
-        review_id = ReviewService.create_review(
+        review = ReviewService.create_review(
             data, self.mock_token, self.mock_breadcrumb
         )
 
-        self.assertEqual(review_id, "123")
+        self.assertEqual(review["_id"], "123")
         mock_mongo.create_document.assert_called_once()
         call_args = mock_mongo.create_document.call_args
         self.assertEqual(call_args[0][0], "Review")
@@ -92,6 +92,7 @@ class TestReviewService(unittest.TestCase):
         mock_collection.find.return_value = mock_cursor
         mock_cursor.sort.return_value = mock_cursor
         mock_cursor.limit.return_value = mock_cursor
+        mock_cursor.batch_size.return_value = mock_cursor
         mock_cursor.__iter__ = lambda self: iter(
             [
                 {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "review1"},
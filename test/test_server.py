@@ -40,24 +40,30 @@ class TestServerInitialization(unittest.TestCase):
     @patch('api_utils.MongoIO.get_instance')
     @patch('api_utils.Config.get_instance')
     def test_mongo_singleton_initialized(self, mock_get_config, mock_get_mongo, mock_signal):
-        """Test that MongoIO singleton is properly initialized."""
+        """Test that MongoIO singleton is initialized and reference data loads lazily."""
         # Arrange
         mock_config = MagicMock()
         mock_config.ENUMERATORS_COLLECTION_NAME = "Enumerators"
         mock_config.VERSIONS_COLLECTION_NAME = "Versions"
         mock_get_config.return_value = mock_config
-        
+
         mock_mongo_instance = MagicMock()
         mock_mongo_instance.get_documents.return_value = []
         mock_get_mongo.return_value = mock_mongo_instance
-        
+
         # Import causes initialization
         import importlib
         import src.server as server_module
         importlib.reload(server_module)
-        
-        # Assert
-        mock_get_mongo.assert_called()
+
+        # Assert - the client and reference data are created lazily, not at boot
+        mock_get_mongo.assert_not_called()
+        self.assertEqual(mock_mongo_instance.get_documents.call_count, 0)
+
+        # First request triggers the client init and enumerators/versions fetch, once
+        server_module.load_reference_data()
+        server_module.load_reference_data()
+        mock_get_mongo.assert_called_once()
         self.assertEqual(mock_mongo_instance.get_documents.call_count, 2)
 
 